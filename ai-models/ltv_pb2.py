@@ -2,7 +2,7 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # NO CHECKED-IN PROTOBUF GENCODE
 # source: ltv.proto
-# Protobuf Python Version: 6.31.1
+# Protobuf Python Version: 7.35.1
 """Generated protocol buffer code."""
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import descriptor_pool as _descriptor_pool
@@ -11,8 +11,8 @@ from google.protobuf import symbol_database as _symbol_database
 from google.protobuf.internal import builder as _builder
 _runtime_version.ValidateProtobufRuntimeVersion(
     _runtime_version.Domain.PUBLIC,
-    6,
-    31,
+    7,
+    35,
     1,
     '',
     'ltv.proto'
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tltv.proto\x12\x03ltv\"Q\n\nLTVRequest\x12\x13\n\x0b\x63ustomer_id\x18\x01 \x01(\t\x12\x14\n\x0crecent_spend\x18\x02 \x01(\x02\x12\x18\n\x10\x65ngagement_score\x18\x03 \x01(\x02\"$\n\x0bLTVResponse\x12\x15\n\rpredicted_ltv\x18\x01 \x01(\x02\x32=\n\nLTVService\x12/\n\nPredictLTV\x12\x0f.ltv.LTVRequest\x1a\x10.ltv.LTVResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\tltv.proto\x12\x03ltv\"Q\n\nLTVRequest\x12\x13\n\x0b\x63ustomer_id\x18\x01 \x01(\t\x12\x14\n\x0crecent_spend\x18\x02 \x01(\x02\x12\x18\n\x10\x65ngagement_score\x18\x03 \x01(\x02\"S\n\x0bLTVResponse\x12\x15\n\rpredicted_ltv\x18\x01 \x01(\x02\x12\x18\n\x10\x63onfidence_score\x18\x02 \x01(\x02\x12\x13\n\x0b\x65xplanation\x18\x03 \x01(\t2w\n\nLTVService\x12/\n\nPredictLTV\x12\x0f.ltv.LTVRequest\x1a\x10.ltv.LTVResponse\x12\x38\n\x0fPredictLTVBatch\x12\x0f.ltv.LTVRequest\x1a\x10.ltv.LTVResponse(\x01\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -34,7 +34,7 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_LTVREQUEST']._serialized_start=18
   _globals['_LTVREQUEST']._serialized_end=99
   _globals['_LTVRESPONSE']._serialized_start=101
-  _globals['_LTVRESPONSE']._serialized_end=137
-  _globals['_LTVSERVICE']._serialized_start=139
-  _globals['_LTVSERVICE']._serialized_end=200
+  _globals['_LTVRESPONSE']._serialized_end=184
+  _globals['_LTVSERVICE']._serialized_start=186
+  _globals['_LTVSERVICE']._serialized_end=305
 # @@protoc_insertion_point(module_scope)
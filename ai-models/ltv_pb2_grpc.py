@@ -5,7 +5,7 @@ import warnings
 
 import ltv_pb2 as ltv__pb2
 
-GRPC_GENERATED_VERSION = '1.76.0'
+GRPC_GENERATED_VERSION = '1.83.1'
 GRPC_VERSION = grpc.__version__
 _version_not_supported = False
 
@@ -25,7 +25,7 @@ if _version_not_supported:
     )
 
 
-class LTVServiceStub(object):
+class LTVServiceStub:
     """gRPC service (single definition)
     """
 
@@ -40,9 +40,14 @@ class LTVServiceStub(object):
                 request_serializer=ltv__pb2.LTVRequest.SerializeToString,
                 response_deserializer=ltv__pb2.LTVResponse.FromString,
                 _registered_method=True)
+        self.PredictLTVBatch = channel.stream_stream(
+                '/ltv.LTVService/PredictLTVBatch',
+                request_serializer=ltv__pb2.LTVRequest.SerializeToString,
+                response_deserializer=ltv__pb2.LTVResponse.FromString,
+                _registered_method=True)
 
 
-class LTVServiceServicer(object):
+class LTVServiceServicer:
     """gRPC service (single definition)
     """
 
@@ -52,6 +57,14 @@ class LTVServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def PredictLTVBatch(self, request_iterator, context):
+        """Batched predictions over one HTTP/2 stream; amortizes per-call
+        HEADERS/stream setup across the whole gallery scan
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_LTVServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -60,6 +73,11 @@ def add_LTVServiceServicer_to_server(servicer, server):
                     request_deserializer=ltv__pb2.LTVRequest.FromString,
                     response_serializer=ltv__pb2.LTVResponse.SerializeToString,
             ),
+            'PredictLTVBatch': grpc.stream_stream_rpc_method_handler(
+                    servicer.PredictLTVBatch,
+                    request_deserializer=ltv__pb2.LTVRequest.FromString,
+                    response_serializer=ltv__pb2.LTVResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'ltv.LTVService', rpc_method_handlers)
@@ -68,7 +86,7 @@ def add_LTVServiceServicer_to_server(servicer, server):
 
 
  # This class is part of an EXPERIMENTAL API.
-class LTVService(object):
+class LTVService:
     """gRPC service (single definition)
     """
 
@@ -98,3 +116,30 @@ class LTVService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def PredictLTVBatch(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/ltv.LTVService/PredictLTVBatch',
+            ltv__pb2.LTVRequest.SerializeToString,
+            ltv__pb2.LTVResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
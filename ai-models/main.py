@@ -46,6 +46,11 @@ class LTVService(pb2_grpc.LTVServiceServicer):
             explanation=json.dumps(explanation)
         )
 
+    def PredictLTVBatch(self, request_iterator, context):
+        # Streamed batch: one HTTP/2 stream serves all requests
+        for request in request_iterator:
+            yield self.PredictLTV(request, context)
+
 def serve():
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
     pb2_grpc.add_LTVServiceServicer_to_server(LTVService(), server)
@@ -1,21 +1,64 @@
-from flask import Flask, send_from_directory
-from core.async_value import ltv_bp
-from core.sync_value import invoice_bp
-from ashield.brand_safety import brand_safety_bp
-from core.creative_gallery import creative_gallery_bp
-
-app = Flask(__name__)
-
-# Serve static videos for gallery
-@app.route('/static/videos/<path:filename>')
-def static_videos(filename):
-    return send_from_directory('output/videos', filename)
-
-# Register blueprints
-app.register_blueprint(ltv_bp, url_prefix='/api')
-app.register_blueprint(invoice_bp, url_prefix='/api')
-app.register_blueprint(brand_safety_bp, url_prefix='/api')
-app.register_blueprint(creative_gallery_bp, url_prefix='/api')
-
-if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=8085)
+import gzip
+
+from flask import Flask, request, send_from_directory
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback when orjson is unavailable
+    orjson = None
+from core.async_value import ltv_bp
+from core.sync_value import invoice_bp
+from ashield.brand_safety import brand_safety_bp
+from core.creative_gallery import creative_gallery_bp, socketio
+
+app = Flask(__name__)
+
+# orjson-backed JSON provider: every jsonify() in the blueprints gets
+# the C serializer without touching individual endpoints
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class _OrjsonProvider(DefaultJSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
+# Compress the larger JSON payloads (history/analytics) when the client
+# advertises gzip; small bodies are not worth the CPU
+MIN_GZIP_SIZE = 1024
+
+@app.after_request
+def _gzip_json(resp):
+    if (resp.direct_passthrough
+            or resp.content_length is None
+            or resp.content_length < MIN_GZIP_SIZE
+            or resp.content_encoding is not None
+            or not resp.mimetype.startswith('application/json')
+            or 'gzip' not in request.headers.get('Accept-Encoding', '')):
+        return resp
+    body = gzip.compress(resp.get_data(), 5)
+    resp.set_data(body)
+    resp.headers['Content-Encoding'] = 'gzip'
+    resp.headers['Content-Length'] = str(len(body))
+    resp.headers.add('Vary', 'Accept-Encoding')
+    return resp
+
+# Serve static videos for gallery
+@app.route('/static/videos/<path:filename>')
+def static_videos(filename):
+    return send_from_directory('output/videos', filename)
+
+# Register blueprints
+app.register_blueprint(ltv_bp, url_prefix='/api')
+app.register_blueprint(invoice_bp, url_prefix='/api')
+app.register_blueprint(brand_safety_bp, url_prefix='/api')
+app.register_blueprint(creative_gallery_bp, url_prefix='/api')
+
+# Attach SocketIO (used for the SyncShield™ live log feed)
+socketio.init_app(app)
+
+if __name__ == '__main__':
+    app.run(debug=True, host='0.0.0.0', port=8085)
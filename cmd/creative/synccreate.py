@@ -38,7 +38,7 @@ class PlatformFormat(Enum):
     GOOGLE_RESPONSIVE = "google_responsive"
 
 
-@dataclass
+@dataclass(slots=True)
 class AudiencePersona:
     """Audience segment from SyncValue™ brain."""
     persona_id: str
@@ -51,7 +51,7 @@ class AudiencePersona:
     ltv_trigger: str  # Specific hook predicted to convert
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductMetadata:
     """Product context for creative generation."""
     product_name: str
@@ -61,7 +61,7 @@ class ProductMetadata:
     visual_assets: List[str]  # Paths to product images
 
 
-@dataclass
+@dataclass(slots=True)
 class BrandGuidelines:
     """Brand identity and safety rules."""
     brand_name: str
@@ -182,7 +182,7 @@ class PromptEngineer:
     """
     
     # Quality boosters (SD XL optimized)
-    QUALITY_BOOSTERS = [
+    QUALITY_BOOSTERS = (
         "masterpiece",
         "best quality",
         "ultra detailed",
@@ -190,7 +190,7 @@ class PromptEngineer:
         "sharp focus",
         "professional photography",
         "award winning composition"
-    ]
+    )
     
     # Lighting techniques
     LIGHTING_STYLES = {
@@ -253,7 +253,14 @@ class PromptEngineer:
         "missing arms, missing legs, extra arms, extra legs, "
         "fused fingers, too many fingers, long neck"
     )
-    
+
+    # Joined once at class creation: the booster list never changes, so
+    # craft_prompt doesn't need to reassemble this string per call
+    QUALITY_STR = ", ".join(
+        f"({boost}:1.1)" if i < 3 else boost
+        for i, boost in enumerate(QUALITY_BOOSTERS)
+    )
+
     @staticmethod
     def craft_prompt(
         product: ProductMetadata,
@@ -340,11 +347,8 @@ class PromptEngineer:
             platform_opt = "versatile layout, adaptive design"
         
         # === TECHNICAL QUALITY ===
-        quality = ", ".join([
-            f"({boost}:1.1)" if i < 3 else boost
-            for i, boost in enumerate(PromptEngineer.QUALITY_BOOSTERS)
-        ])
-        
+        quality = PromptEngineer.QUALITY_STR
+
         # === ASSEMBLE POSITIVE PROMPT ===
         positive_prompt = ", ".join([
             subject,
@@ -458,7 +462,7 @@ class BrandSafetyGuardrails:
     
     def __init__(self, guidelines: BrandGuidelines):
         self.guidelines = guidelines
-        
+
         # Pre-defined unsafe patterns (can be enhanced with ML models)
         self.unsafe_patterns = [
             r'\b(violence|weapon|drug|alcohol|tobacco)\b',
@@ -466,6 +470,25 @@ class BrandSafetyGuardrails:
             r'\b(explicit|nude|nsfw)\b',
             r'\b(clickbait|fake|scam|limited time offer)\b',  # Gate 2: Copy Integrity
         ]
+
+        # Compile every matcher once per instance: the term lists become
+        # single alternations scanned in one C-level pass per check
+        # instead of a Python loop of substring searches per call
+        self._prohibited_re, self._prohibited_src = self._compile_terms(guidelines.prohibited_terms)
+        self._concepts_re, self._concepts_src = self._compile_terms(guidelines.prohibited_concepts)
+        self._clickbait_re = re.compile(r'\b(limited time|act now|exclusive deal|guaranteed)\b')
+        self._unsafe_res = [re.compile(p) for p in self.unsafe_patterns]
+
+    @staticmethod
+    def _compile_terms(terms):
+        """Build one alternation over lowercased terms plus a map back to
+        the original spelling for violation messages. Plain substring
+        semantics are kept (no word boundaries), matching the old loop."""
+        if not terms:
+            return None, {}
+        src = {t.lower(): t for t in terms}
+        pattern = re.compile('|'.join(re.escape(t) for t in src))
+        return pattern, src
     
     def three_gate_safety_check(
         self,
@@ -486,25 +509,25 @@ class BrandSafetyGuardrails:
         
         # GATE 2: Copy Integrity
         # Check prohibited terms
-        for term in self.guidelines.prohibited_terms:
-            if term.lower() in text_lower:
-                violations.append(f"Prohibited term: '{term}'")
+        if self._prohibited_re:
+            for hit in dict.fromkeys(self._prohibited_re.findall(text_lower)):
+                violations.append(f"Prohibited term: '{self._prohibited_src[hit]}'")
                 filters_triggered.append("prohibited_terms")
-        
+
         # Check for clickbait/deceptive patterns
-        if re.search(r'\b(limited time|act now|exclusive deal|guaranteed)\b', text_lower):
+        if self._clickbait_re.search(text_lower):
             warnings.append("Potential clickbait language detected")
             filters_triggered.append("copy_integrity")
-        
+
         # Check prohibited concepts
-        for concept in self.guidelines.prohibited_concepts:
-            if concept.lower() in text_lower:
-                violations.append(f"Prohibited concept: '{concept}'")
+        if self._concepts_re:
+            for hit in dict.fromkeys(self._concepts_re.findall(text_lower)):
+                violations.append(f"Prohibited concept: '{self._concepts_src[hit]}'")
                 filters_triggered.append("prohibited_concepts")
-        
+
         # Check unsafe patterns
-        for pattern in self.unsafe_patterns:
-            matches = re.findall(pattern, text_lower)
+        for pattern in self._unsafe_res:
+            matches = pattern.findall(text_lower)
             if matches:
                 violations.append(f"Unsafe content detected: {matches}")
                 filters_triggered.append("unsafe_patterns")
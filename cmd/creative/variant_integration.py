@@ -293,7 +293,7 @@ Daily Spend:           ${snapshot.estimated_daily_spend:>11.2f}
 VARIANT PERFORMANCE
 {'─'*100}
 
-{f'{'Variant':<20} {'Impressions':<15} {'CTR':<12} {'Conv Rate':<12} {'Status':<15}'}
+{f"{'Variant':<20} {'Impressions':<15} {'CTR':<12} {'Conv Rate':<12} {'Status':<15}"}
 {'-'*74}
 """
         
@@ -359,7 +359,7 @@ Created: {portfolio.created_at.strftime('%Y-%m-%d %H:%M:%S')}
 VARIANT PERFORMANCE COMPARISON
 {'─'*100}
 
-{f'{'Variant':<20} {'Impressions':<15} {'Clicks':<15} {'CTR':<12} {'Conversions':<15} {'Conv Rate':<12}'}
+{f"{'Variant':<20} {'Impressions':<15} {'Clicks':<15} {'CTR':<12} {'Conversions':<15} {'Conv Rate':<12}"}
 {'-'*89}
 """
         
@@ -50,6 +50,34 @@ class ImageQualityMetrics:
     overall_quality: float  # Weighted average
 
 
+@dataclass(frozen=True, slots=True)
+class BrandGuidelines:
+    """Normalized brand guidelines for vision validation.
+
+    Frozen + slots makes instances hashable (safe to use in cache keys)
+    and turns the repeated ``dict.get`` lookups in the validators into
+    C-level attribute access.
+    """
+
+    brand_name: str = ""
+    tone_of_voice: str = "professional"
+    style_guide: str = "professional"
+    prohibited_concepts: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> "BrandGuidelines":
+        """Build from a raw guidelines dict; idempotent for instances."""
+        if isinstance(data, cls):
+            return data
+        data = data or {}
+        return cls(
+            brand_name=data.get('brand_name', ''),
+            tone_of_voice=data.get('tone_of_voice', 'professional'),
+            style_guide=data.get('style_guide', 'professional'),
+            prohibited_concepts=tuple(data.get('prohibited_concepts', ()))
+        )
+
+
 class ObjectDetectionType(Enum):
     """Types of objects that can be detected."""
     PRODUCT = "product"
@@ -64,29 +92,93 @@ class ObjectDetectionType(Enum):
 # CLIP EMBEDDINGS & SIMILARITY
 # ============================================================================
 
+CLIP_MODEL_NAME = "openai/clip-vit-large-patch14"
+CLIP_VISION_INT8_PATH = Path("models/clip_vision_int8.onnx")
+
+
+def quantize_clip_vision_tower(
+    model_name: str = CLIP_MODEL_NAME,
+    output_path: Path = CLIP_VISION_INT8_PATH
+) -> Path:
+    """Export the CLIP vision tower to ONNX and INT8-quantize its weights.
+
+    The embeddings only feed cosine-similarity thresholding, which
+    tolerates quantization noise, so dynamic INT8 gives ~4x CPU
+    throughput and memory reduction with negligible score drift.
+    """
+    import torch
+    from transformers import CLIPModel
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fp32_path = output_path.with_name(output_path.stem.replace('_int8', '') + '_fp32.onnx')
+
+    model = CLIPModel.from_pretrained(model_name).vision_model.eval()
+    dummy = torch.randn(1, 3, 224, 224)
+    torch.onnx.export(
+        model,
+        dummy,
+        str(fp32_path),
+        input_names=["pixel_values"],
+        output_names=["pooler_output"],
+        dynamic_axes={"pixel_values": {0: "batch"}}
+    )
+
+    quantize_dynamic(
+        model_input=str(fp32_path),
+        model_output=str(output_path),
+        weight_type=QuantType.QInt8
+    )
+    return output_path
+
+
 class CLIPEmbeddingEngine:
     """
     CLIP model for image and text embeddings.
     Uses cosine similarity to compare concepts.
     """
-    
-    def __init__(self, use_mock: bool = True):
+
+    def __init__(self, use_mock: bool = True, backend: Optional[str] = None):
         """Initialize CLIP engine.
-        
+
         Args:
             use_mock: Use mock embeddings if True (no model loading)
+            backend: Embedding backend - "mock", "transformers", or
+                "onnx_int8" (quantized vision tower for CPU deployment)
         """
-        self.use_mock = use_mock
+        if backend is None:
+            backend = "mock" if use_mock else "transformers"
+        self.backend = backend
+        self.use_mock = backend == "mock"
         self.model = None
         self.processor = None
-        
-        if not use_mock:
+        self.vision_session = None
+
+        if backend == "transformers":
             try:
                 from transformers import CLIPProcessor, CLIPModel
-                self.model = CLIPModel.from_pretrained("openai/clip-vit-large-patch14")
-                self.processor = CLIPProcessor.from_pretrained("openai/clip-vit-large-patch14")
+                self.model = CLIPModel.from_pretrained(CLIP_MODEL_NAME)
+                self.processor = CLIPProcessor.from_pretrained(CLIP_MODEL_NAME)
             except ImportError:
                 print("Warning: transformers not installed. Using mock embeddings.")
+                self.backend = "mock"
+                self.use_mock = True
+        elif backend == "onnx_int8":
+            try:
+                import onnxruntime
+                from transformers import CLIPProcessor, CLIPModel
+                if not CLIP_VISION_INT8_PATH.exists():
+                    quantize_clip_vision_tower()
+                self.vision_session = onnxruntime.InferenceSession(
+                    str(CLIP_VISION_INT8_PATH),
+                    providers=["CPUExecutionProvider"]
+                )
+                # Text tower stays fp32; it is cheap and heavily cached
+                self.model = CLIPModel.from_pretrained(CLIP_MODEL_NAME)
+                self.processor = CLIPProcessor.from_pretrained(CLIP_MODEL_NAME)
+            except ImportError:
+                print("Warning: onnxruntime/transformers not installed. Using mock embeddings.")
+                self.backend = "mock"
                 self.use_mock = True
     
     def generate_mock_embedding(self, text: str) -> np.ndarray:
@@ -116,6 +208,16 @@ class CLIPEmbeddingEngine:
         
         from PIL import Image
         image = Image.open(image_path)
+
+        if self.vision_session is not None:
+            # INT8 vision tower on CPU via onnxruntime
+            inputs = self.processor(images=image, return_tensors="np")
+            (pooled,) = self.vision_session.run(
+                ["pooler_output"],
+                {"pixel_values": inputs["pixel_values"]}
+            )
+            return pooled[0]
+
         inputs = self.processor(images=image, return_tensors="pt")
         with torch.no_grad():
             image_features = self.model.get_image_features(**inputs)
@@ -144,14 +246,16 @@ class VisionValidator:
     Validates product detection, safety, quality, and brand fit.
     """
     
-    def __init__(self, use_mock: bool = True):
+    def __init__(self, use_mock: bool = True, backend: Optional[str] = None):
         """Initialize vision validator.
-        
+
         Args:
             use_mock: Use mock embeddings if True
+            backend: Embedding backend passed to CLIPEmbeddingEngine
+                (e.g. "onnx_int8" for the quantized CPU vision tower)
         """
-        self.clip_engine = CLIPEmbeddingEngine(use_mock=use_mock)
-        self.use_mock = use_mock
+        self.clip_engine = CLIPEmbeddingEngine(use_mock=use_mock, backend=backend)
+        self.use_mock = self.clip_engine.use_mock
         
         # Detection thresholds
         self.product_detection_threshold = 0.7
@@ -173,12 +277,16 @@ class VisionValidator:
             image_path: Path to image file
             expected_product: Product name/description to detect
             brand_guidelines: Brand safety and style guidelines
+                (raw dict or pre-normalized BrandGuidelines)
             variant_type: Type of creative (control, lifestyle, etc)
-        
+
         Returns:
             CLIPValidationResult with validation details
         """
-        
+
+        # Normalize guidelines once; downstream code uses attribute access
+        guidelines = BrandGuidelines.from_dict(brand_guidelines)
+
         # Get image embedding
         image_embedding = self.clip_engine.get_image_embedding(image_path)
         
@@ -192,7 +300,7 @@ class VisionValidator:
         # 2. SAFETY VALIDATION
         safety_score, safety_flags = self._validate_safety(
             image_embedding,
-            brand_guidelines or {}
+            guidelines
         )
         
         # 3. QUALITY ASSESSMENT
@@ -203,7 +311,7 @@ class VisionValidator:
         composition_score = self._assess_composition(image_path, variant_type)
         brand_fit_score = self._assess_brand_fit(
             image_embedding,
-            brand_guidelines or {},
+            guidelines,
             variant_type
         )
         
@@ -275,16 +383,15 @@ class VisionValidator:
     def _validate_safety(
         self,
         image_embedding: np.ndarray,
-        brand_guidelines: Dict
+        brand_guidelines: BrandGuidelines
     ) -> Tuple[float, List[str]]:
         """Validate image for safety violations."""
-        
+
         safety_flags = []
         safety_score = 1.0
-        
+
         # Check for prohibited concepts
-        prohibited = brand_guidelines.get('prohibited_concepts', [])
-        for concept in prohibited:
+        for concept in brand_guidelines.prohibited_concepts:
             concept_embedding = self.clip_engine.get_text_embedding(concept)
             sim = self.clip_engine.cosine_similarity(
                 image_embedding,
@@ -399,15 +506,15 @@ class VisionValidator:
     def _assess_brand_fit(
         self,
         image_embedding: np.ndarray,
-        brand_guidelines: Dict,
+        brand_guidelines: BrandGuidelines,
         variant_type: str
     ) -> float:
         """Assess how well image fits brand guidelines."""
-        
+
         brand_fit_score = 0.8
-        
+
         # Check against brand tone
-        tone_of_voice = brand_guidelines.get('tone_of_voice', 'professional')
+        tone_of_voice = brand_guidelines.tone_of_voice
         tone_embedding = self.clip_engine.get_text_embedding(
             f"A {tone_of_voice} advertisement"
         )
@@ -420,7 +527,7 @@ class VisionValidator:
         brand_fit_score *= tone_sim
         
         # Check style alignment
-        style_guide = brand_guidelines.get('style_guide', 'professional')
+        style_guide = brand_guidelines.style_guide
         style_embedding = self.clip_engine.get_text_embedding(
             f"A {style_guide} design style"
         )
@@ -558,8 +665,8 @@ class VisionGuardWithVariantOptimization:
     variant-specific feedback.
     """
     
-    def __init__(self, use_mock: bool = True):
-        self.validator = VisionValidator(use_mock=use_mock)
+    def __init__(self, use_mock: bool = True, backend: Optional[str] = None):
+        self.validator = VisionValidator(use_mock=use_mock, backend=backend)
         
         # Variant-specific validation profiles
         self.variant_profiles = {
@@ -606,7 +713,10 @@ class VisionGuardWithVariantOptimization:
         
         Returns enhanced validation with variant-specific checks.
         """
-        
+
+        # Normalize once for this request; validate_image reuses the instance
+        brand_guidelines = BrandGuidelines.from_dict(brand_guidelines)
+
         # Run base validation
         result = self.validator.validate_image(
             image_path=image_path,
@@ -620,7 +730,7 @@ class VisionGuardWithVariantOptimization:
             image_path=image_path,
             result=result,
             variant_type=variant_type,
-            brand_guidelines=brand_guidelines or {}
+            brand_guidelines=brand_guidelines
         )
         
         return {
@@ -648,7 +758,7 @@ class VisionGuardWithVariantOptimization:
         image_path: str,
         result: CLIPValidationResult,
         variant_type: str,
-        brand_guidelines: Dict
+        brand_guidelines: BrandGuidelines
     ) -> Dict:
         """Check variant-specific requirements."""
         
@@ -9,8 +9,13 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
+import numpy as np
 
-from cmd.creative.vision_guard import VisionGuardWithVariantOptimization, CLIPValidationResult
+from cmd.creative.vision_guard import (
+    VisionGuardWithVariantOptimization,
+    CLIPValidationResult,
+    BrandGuidelines,
+)
 from cmd.creative.variant_strategy import VariantPortfolio, VARIANT_STRATEGY_LIBRARY
 
 
@@ -45,6 +50,12 @@ class VariantImageValidator:
     def __init__(self, use_mock: bool = True):
         self.vision_guard = VisionGuardWithVariantOptimization(use_mock=use_mock)
         self.validation_cache: Dict[str, VariantImageQuality] = {}
+        # Struct-of-arrays score columns, filled per portfolio run so
+        # ranking/reporting can work on numpy columns instead of pulling
+        # fields object-by-object
+        self._columns: Dict[str, List[float]] = {
+            "overall": [], "product": [], "safety": [], "quality": [], "brand": []
+        }
     
     def validate_portfolio_images(
         self,
@@ -63,23 +74,34 @@ class VariantImageValidator:
         Returns:
             Dict mapping variant types to VariantImageQuality
         """
-        
+
+        # Normalize guidelines once for the whole portfolio
+        brand_guidelines = BrandGuidelines.from_dict(brand_guidelines)
+
         results = {}
-        
+        self._columns = {
+            "overall": [], "product": [], "safety": [], "quality": [], "brand": []
+        }
+
         for variant_type, image_path in image_paths.items():
             if not Path(image_path).exists():
                 print(f"Warning: Image not found for {variant_type}: {image_path}")
                 continue
-            
+
             quality = self.validate_variant_image(
                 image_path=image_path,
                 variant_type=variant_type,
                 product_name=portfolio.product_name,
                 brand_guidelines=brand_guidelines
             )
-            
+
             results[variant_type] = quality
-        
+            self._columns["overall"].append(quality.overall_score)
+            self._columns["product"].append(quality.product_confidence)
+            self._columns["safety"].append(quality.safety_score)
+            self._columns["quality"].append(quality.quality_score)
+            self._columns["brand"].append(quality.brand_fit)
+
         return results
     
     def validate_variant_image(
@@ -101,12 +123,12 @@ class VariantImageValidator:
         if cache_key in self.validation_cache:
             return self.validation_cache[cache_key]
         
-        # Run validation
+        # Run validation (validate_variant normalizes dict guidelines)
         validation = self.vision_guard.validate_variant(
             image_path=image_path,
             product_name=product_name,
             variant_type=variant_type,
-            brand_guidelines=brand_guidelines or {}
+            brand_guidelines=brand_guidelines
         )
         
         # Extract results
@@ -149,27 +171,41 @@ class VariantImageValidator:
 
 class QualityBasedRanking:
     """Rank variants by vision quality scores."""
-    
+
+    @staticmethod
+    def _score_columns(
+        quality_results: Dict[str, VariantImageQuality]
+    ) -> Dict[str, np.ndarray]:
+        """Build struct-of-arrays score columns from quality results."""
+        qualities = list(quality_results.values())
+        return {
+            "overall": np.array([q.overall_score for q in qualities]),
+            "product": np.array([q.product_confidence for q in qualities]),
+            "safety": np.array([q.safety_score for q in qualities]),
+            "quality": np.array([q.quality_score for q in qualities]),
+            "brand": np.array([q.brand_fit for q in qualities]),
+        }
+
     @staticmethod
     def rank_by_quality(
         quality_results: Dict[str, VariantImageQuality]
     ) -> List[tuple]:
         """
         Rank variants by overall quality score.
-        
+
         Returns:
             List of (variant_type, quality) tuples sorted by quality (best first)
         """
-        
-        ranking = []
-        for variant_type, quality in quality_results.items():
-            ranking.append((
-                variant_type,
-                quality.overall_score,
-                quality
-            ))
-        
-        return sorted(ranking, key=lambda x: x[1], reverse=True)
+
+        variants = list(quality_results.keys())
+        overall = np.array([quality_results[vt].overall_score for vt in variants])
+        # Single argsort on the score column instead of a keyed Python sort
+        order = np.argsort(-overall)
+
+        return [
+            (variants[i], float(overall[i]), quality_results[variants[i]])
+            for i in order
+        ]
     
     @staticmethod
     def get_quality_tier(score: float) -> str:
@@ -197,26 +233,33 @@ class QualityBasedRanking:
 
 """
         
-        # Rank variants
-        ranking = QualityBasedRanking.rank_by_quality(quality_results)
-        
+        # Rank via the score columns (one argsort, rows from column slices)
+        variants = list(quality_results.keys())
+        columns = QualityBasedRanking._score_columns(quality_results)
+        order = np.argsort(-columns["overall"])
+
         report += f"{'Variant':<20} {'Overall':<10} {'Product':<10} {'Safety':<10} {'Quality':<10} {'Brand':<10} {'Status':<25}\n"
         report += "-"*95 + "\n"
-        
-        for variant_type, overall_score, quality in ranking:
-            tier = QualityBasedRanking.get_quality_tier(overall_score)
-            
+
+        for i in order:
+            tier = QualityBasedRanking.get_quality_tier(columns["overall"][i])
+
             report += (
-                f"{variant_type:<20} "
-                f"{overall_score:>8.1%}  "
-                f"{quality.product_confidence:>8.1%}  "
-                f"{quality.safety_score:>8.1%}  "
-                f"{quality.quality_score:>8.1%}  "
-                f"{quality.brand_fit:>8.1%}  "
+                f"{variants[i]:<20} "
+                f"{columns['overall'][i]:>8.1%}  "
+                f"{columns['product'][i]:>8.1%}  "
+                f"{columns['safety'][i]:>8.1%}  "
+                f"{columns['quality'][i]:>8.1%}  "
+                f"{columns['brand'][i]:>8.1%}  "
                 f"{tier:<25}\n"
             )
-        
+
         report += "\n" + "-"*95 + "\n\n"
+
+        ranking = [
+            (variants[i], float(columns["overall"][i]), quality_results[variants[i]])
+            for i in order
+        ]
         
         # Detailed findings
         report += "DETAILED FINDINGS\n\n"
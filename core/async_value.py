@@ -1,18 +1,92 @@
-# async_value.py
-
-from flask import Blueprint, jsonify, request
-import asyncio
-
-ltv_bp = Blueprint('ltv', __name__)
-
-async def async_ltv_logic(input_data):
-    # Placeholder for dRNN or async LTV logic
-    await asyncio.sleep(0.1)
-    # Simulate LTV calculation
-    return {'ltv': 123.45, 'input': input_data}
-
-@ltv_bp.route('/ltv', methods=['POST'])
-async def calculate_ltv():
-    data = request.get_json()
-    result = await async_ltv_logic(data)
-    return jsonify(result)
+# async_value.py
+
+from flask import Blueprint, Response, request
+import asyncio
+import threading
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback when orjson is unavailable
+    orjson = None
+    import json
+
+ltv_bp = Blueprint('ltv', __name__)
+
+# One long-lived event loop on a daemon thread, shared by all /ltv requests
+# instead of spinning a fresh loop up per call.
+_loop = asyncio.new_event_loop()
+_loop_thread = threading.Thread(target=_loop.run_forever, daemon=True)
+_loop_thread.start()
+
+
+def _json_response(payload, status=200):
+    """Serialize with orjson (C-speed) when available, stdlib json otherwise."""
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload).encode('utf-8')
+    return Response(body, status=status, mimetype='application/json')
+
+
+# Micro-batching: bursts of LTV requests are coalesced into one vectorized
+# model call instead of paying per-request model dispatch.
+_BATCH_MAX = 64
+_BATCH_WINDOW = 0.01  # seconds to wait for more requests to join a batch
+
+_queue = None
+_batcher_task = None
+
+
+def _ltv_vectorized(batch_inputs):
+    # Placeholder for the vectorized dRNN/LTV model call; one invocation
+    # serves the whole batch.
+    return [{'ltv': 123.45, 'input': data} for data in batch_inputs]
+
+
+async def _drain(queue, max_n, max_wait):
+    """Collect up to max_n queued requests within a max_wait window."""
+    batch = [await queue.get()]
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait
+    while len(batch) < max_n:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+    return batch
+
+
+async def _batch_worker():
+    while True:
+        batch = await _drain(_queue, _BATCH_MAX, _BATCH_WINDOW)
+        results = _ltv_vectorized([data for data, _ in batch])
+        for (_, fut), result in zip(batch, results):
+            if not fut.done():
+                fut.set_result(result)
+
+
+def _ensure_batcher():
+    """Start the batching task lazily, on the shared loop."""
+    global _queue, _batcher_task
+    if _queue is None:
+        _queue = asyncio.Queue()
+        _batcher_task = asyncio.get_running_loop().create_task(_batch_worker())
+
+
+async def async_ltv_logic(input_data):
+    _ensure_batcher()
+    fut = asyncio.get_running_loop().create_future()
+    await _queue.put((input_data, fut))
+    return await fut
+
+
+@ltv_bp.route('/ltv', methods=['POST'])
+def calculate_ltv():
+    data = request.get_json()
+    # Reuse the shared loop rather than creating one per request
+    future = asyncio.run_coroutine_threadsafe(async_ltv_logic(data), _loop)
+    result = future.result()
+    return _json_response(result)
@@ -1,76 +1,103 @@
-import sqlite3
-import threading
-from datetime import datetime
-
-class SyncHub:
-    def __init__(self, db_path='synchub.db'):
-        self.db_path = db_path
-        self._init_db()
-        self.lock = threading.Lock()
-
-    def _init_db(self):
-        with sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute('''CREATE TABLE IF NOT EXISTS events (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT,
-                agent TEXT,
-                event_type TEXT,
-                payload TEXT
-            )''')
-            c.execute('''CREATE TABLE IF NOT EXISTS signals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT,
-                source_agent TEXT,
-                target_agent TEXT,
-                signal_type TEXT,
-                payload TEXT
-            )''')
-            c.execute('''CREATE TABLE IF NOT EXISTS retraining_requests (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT,
-                model_name TEXT,
-                reason TEXT,
-                status TEXT
-            )''')
-            conn.commit()
-
-    def log_event(self, agent, event_type, payload):
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute('INSERT INTO events (timestamp, agent, event_type, payload) VALUES (?, ?, ?, ?)',
-                      (datetime.utcnow().isoformat(), agent, event_type, payload))
-            conn.commit()
-
-    def send_signal(self, source_agent, target_agent, signal_type, payload):
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute('INSERT INTO signals (timestamp, source_agent, target_agent, signal_type, payload) VALUES (?, ?, ?, ?, ?)',
-                      (datetime.utcnow().isoformat(), source_agent, target_agent, signal_type, payload))
-            conn.commit()
-
-    def trigger_retraining(self, model_name, reason):
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute('INSERT INTO retraining_requests (timestamp, model_name, reason, status) VALUES (?, ?, ?, ?)',
-                      (datetime.utcnow().isoformat(), model_name, reason, 'pending'))
-            conn.commit()
-        self.log_event('SyncHub', 'RetrainingEvent', f'{model_name} retraining triggered: {reason}')
-
-    def get_pending_retraining(self):
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute('SELECT * FROM retraining_requests WHERE status = ?', ('pending',))
-            return c.fetchall()
-
-    def complete_retraining(self, retrain_id):
-        with self.lock, sqlite3.connect(self.db_path) as conn:
-            c = conn.cursor()
-            c.execute('UPDATE retraining_requests SET status = ? WHERE id = ?', ('complete', retrain_id))
-            conn.commit()
-
-# Example usage:
-# hub = SyncHub()
-# hub.log_event('SyncValue', 'LTVDrop', '{"ltv": 0.42}')
-# hub.send_signal('SyncValue', 'SyncCreate', 'HighPriority', '{"action": "retrain"}')
-# hub.trigger_retraining('dRNN', 'LTV accuracy dropped below threshold')
+import sqlite3
+import threading
+from datetime import datetime
+
+class SyncHub:
+    def __init__(self, db_path='synchub.db'):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        # Signalled after every event insert so consumers (e.g. the
+        # cloud pusher) can wake immediately instead of polling
+        self.event_cond = threading.Condition()
+        # One long-lived connection: connecting per call paid a file
+        # open and schema parse each time, and every commit forced a
+        # full fsync. WAL lets readers run alongside the writer and
+        # synchronous=NORMAL still survives application crashes.
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute('PRAGMA temp_store=MEMORY')
+        self._init_db()
+
+    def _init_db(self):
+        with self.lock:
+            c = self.conn.cursor()
+            c.execute('''CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT,
+                agent TEXT,
+                event_type TEXT,
+                payload TEXT
+            )''')
+            c.execute('''CREATE TABLE IF NOT EXISTS signals (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT,
+                source_agent TEXT,
+                target_agent TEXT,
+                signal_type TEXT,
+                payload TEXT
+            )''')
+            c.execute('''CREATE TABLE IF NOT EXISTS retraining_requests (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT,
+                model_name TEXT,
+                reason TEXT,
+                status TEXT
+            )''')
+            # Covering indexes for the standing queries: pending
+            # retraining lookups and the per-agent latest-signal poll
+            c.execute('''CREATE INDEX IF NOT EXISTS idx_signals_target_type_id
+                         ON signals(target_agent, signal_type, id DESC)''')
+            c.execute('''CREATE INDEX IF NOT EXISTS idx_retrain_status
+                         ON retraining_requests(status)''')
+            c.execute('''CREATE INDEX IF NOT EXISTS idx_events_agent_ts
+                         ON events(agent, timestamp)''')
+            self.conn.commit()
+
+    def log_event(self, agent, event_type, payload):
+        with self.lock:
+            self.conn.execute('INSERT INTO events (timestamp, agent, event_type, payload) VALUES (?, ?, ?, ?)',
+                              (datetime.utcnow().isoformat(), agent, event_type, payload))
+            self.conn.commit()
+        with self.event_cond:
+            self.event_cond.notify_all()
+
+    def log_events_bulk(self, rows):
+        """Insert many (agent, event_type, payload) tuples in one transaction."""
+        timestamp = datetime.utcnow().isoformat()
+        with self.lock:
+            self.conn.executemany(
+                'INSERT INTO events (timestamp, agent, event_type, payload) VALUES (?, ?, ?, ?)',
+                [(timestamp, agent, event_type, payload) for agent, event_type, payload in rows])
+            self.conn.commit()
+        with self.event_cond:
+            self.event_cond.notify_all()
+
+    def send_signal(self, source_agent, target_agent, signal_type, payload):
+        with self.lock:
+            self.conn.execute('INSERT INTO signals (timestamp, source_agent, target_agent, signal_type, payload) VALUES (?, ?, ?, ?, ?)',
+                              (datetime.utcnow().isoformat(), source_agent, target_agent, signal_type, payload))
+            self.conn.commit()
+
+    def trigger_retraining(self, model_name, reason):
+        with self.lock:
+            self.conn.execute('INSERT INTO retraining_requests (timestamp, model_name, reason, status) VALUES (?, ?, ?, ?)',
+                              (datetime.utcnow().isoformat(), model_name, reason, 'pending'))
+            self.conn.commit()
+        self.log_event('SyncHub', 'RetrainingEvent', f'{model_name} retraining triggered: {reason}')
+
+    def get_pending_retraining(self):
+        with self.lock:
+            c = self.conn.execute('SELECT * FROM retraining_requests WHERE status = ?', ('pending',))
+            return c.fetchall()
+
+    def complete_retraining(self, retrain_id):
+        with self.lock:
+            self.conn.execute('UPDATE retraining_requests SET status = ? WHERE id = ?', ('complete', retrain_id))
+            self.conn.commit()
+
+# Example usage:
+# hub = SyncHub()
+# hub.log_event('SyncValue', 'LTVDrop', '{"ltv": 0.42}')
+# hub.send_signal('SyncValue', 'SyncCreate', 'HighPriority', '{"action": "retrain"}')
+# hub.trigger_retraining('dRNN', 'LTV accuracy dropped below threshold')
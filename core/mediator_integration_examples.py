@@ -26,16 +26,20 @@ import time
 hub = SyncHub()
 
 def listen_for_signals():
+    # Cursor over the autoincrement id: each poll reads only signals it
+    # has not seen yet via the PK index, on the hub's shared connection
+    # (the schema is already in place from SyncHub.__init__)
+    last_seen_signal_id = 0
     while True:
-        # Poll for signals
-        with hub.lock, hub._init_db(), sqlite3.connect(hub.db_path) as conn:
-            c = conn.cursor()
-            c.execute('SELECT * FROM signals WHERE target_agent = ? AND signal_type = ? ORDER BY id DESC LIMIT 1', ('SyncCreate', 'HighPriority'))
-            row = c.fetchone()
-            if row:
-                # Take action (e.g., retrain model)
-                print(f"[SyncCreate] Received signal: {row}")
-                # Mark signal as processed or delete if needed
+        with hub.lock:
+            c = hub.conn.execute(
+                'SELECT * FROM signals WHERE target_agent = ? AND signal_type = ? AND id > ? ORDER BY id',
+                ('SyncCreate', 'HighPriority', last_seen_signal_id))
+            rows = c.fetchall()
+        for row in rows:
+            # Take action (e.g., retrain model)
+            print(f"[SyncCreate] Received signal: {row}")
+            last_seen_signal_id = row[0]
         time.sleep(10)
 
 t2 = threading.Thread(target=listen_for_signals, daemon=True)
@@ -57,11 +61,20 @@ def update_confidence_from_revenue(creative_id, revenue):
     hub.log_event('SyncValue', 'ConfidenceUpdate', f'{{"creative_id": "{creative_id}", "revenue": {revenue}}}')
 
 # Example: Cloud integration (push to external API)
+# Pooled session: keep-alive reuses the TCP+TLS connection across
+# pushes instead of paying a fresh handshake per event
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=4, pool_maxsize=16,
+    max_retries=Retry(total=1, backoff_factor=0.1)))
+
 def push_event_to_cloud(event):
     url = 'https://your-cloud-endpoint/api/events'
     try:
-        requests.post(url, json=event, timeout=2)
+        _session.post(url, json=event, timeout=2)
     except Exception:
         pass
 
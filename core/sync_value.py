@@ -1,9 +1,15 @@
 from flask import Blueprint, request, jsonify
 import asyncio
+import os
+
+# Artificial dRNN latency only when explicitly demoing; in steady state
+# the simulated call just yields to the loop instead of anchoring every
+# invoice request at a fixed 100 ms
+DEMO_MODE = os.environ.get('KIKI_DEMO_MODE') == '1'
 
 # Simulate dRNN output for demo
 async def get_drnn_output(data):
-    await asyncio.sleep(0.1)
+    await asyncio.sleep(0.1 if DEMO_MODE else 0)
     # Example output
     return {
         'customer_id': data.get('customer_id', 'demo'),
@@ -14,13 +20,11 @@ async def get_drnn_output(data):
         'details': 'Simulated dRNN output'
     }
 
+_REDACT_KEYS = ('email', 'customer_id', 'company')
+
 async def kiki_guardrails(payload):
-    # Remove sensitive fields for logging
-    safe = dict(payload)
-    for key in ['email', 'customer_id', 'company']:
-        if key in safe:
-            safe[key] = '[REDACTED]'
-    return safe
+    # Remove sensitive fields for logging: one dict merge, no per-key loop
+    return payload | {k: '[REDACTED]' for k in _REDACT_KEYS if k in payload}
 
 invoice_bp = Blueprint('invoice', __name__)
 
@@ -22,6 +22,12 @@ def init_db():
             extra JSON
         )
     ''')
+    # Composite index so the date-windowed top-styles query range-scans
+    # instead of reading the whole table
+    c.execute('''
+        CREATE INDEX IF NOT EXISTS idx_cp_approved_style
+        ON creative_performance(approved_at, style)
+    ''')
     conn.commit()
     conn.close()
 
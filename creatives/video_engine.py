@@ -1,64 +1,90 @@
-import os
-from pathlib import Path
-from moviepy.editor import VideoFileClip, ImageClip, CompositeVideoClip, TextClip
-from moviepy.video.fx.all import resize
-from PIL import Image
-
-class SyncCreateVideo:
-    def __init__(self, bg_image_path, product, logo_path=None, font_path=None):
-        self.bg_image_path = Path(bg_image_path)
-        self.product = product
-        self.logo_path = Path(logo_path) if logo_path else Path('assets/logo.png')
-        self.font_path = font_path or 'assets/fonts/Inter-Bold.ttf'
-        self.kiki_green = '#00ff88'
-        self.duration = 5
-        self.resolution = (1080, 1920)  # 9:16 vertical
-
-    def make_video(self, output_path):
-        # Background with subtle zoom-in
-        bg_clip = ImageClip(str(self.bg_image_path)).set_duration(self.duration)
-        bg_clip = bg_clip.resize(newsize=self.resolution)
-        bg_clip = bg_clip.fx(resize, lambda t: 1 + 0.03 * t)  # 3% zoom over 5s
-
-        # Brand logo (top-right)
-        logo = Image.open(self.logo_path)
-        logo_w = int(self.resolution[0] * 0.18)
-        logo_h = int(logo_w * logo.height / logo.width)
-        logo = logo.resize((logo_w, logo_h))
-        logo_path_tmp = 'assets/_logo_tmp.png'
-        logo.save(logo_path_tmp)
-        logo_clip = (ImageClip(logo_path_tmp)
-                     .set_duration(self.duration)
-                     .set_position((self.resolution[0] - logo_w - 40, 40)))
-
-        # High-contrast hook text (center)
-        hook = self.product.get('hook', 'Your Next Best Seller')
-        text_clip = (TextClip(hook, fontsize=110, font=self.font_path, color=self.kiki_green, method='label')
-                     .set_position('center')
-                     .set_duration(self.duration)
-                     .margin(top=0, opacity=0))
-
-        # SyncShield™: Safe zone check for text overlay
-        # TikTok safe zone: avoid bottom 300px and right 200px for overlays
-        # (approximate, can be tuned)
-        text_box = text_clip.size
-        text_x, text_y = (self.resolution[0] - text_box[0]) // 2, (self.resolution[1] - text_box[1]) // 2
-        safe_top = 100
-        safe_bottom = self.resolution[1] - 300
-        safe_left = 40
-        safe_right = self.resolution[0] - 200
-        if not (safe_left < text_x < safe_right and safe_top < text_y < safe_bottom):
-            raise ValueError("SyncShield™: Text overlay is outside TikTok safe zone.")
-
-        # Compose layers
-        video = CompositeVideoClip([bg_clip, logo_clip, text_clip], size=self.resolution)
-        video = video.set_duration(self.duration)
-        video.write_videofile(output_path, fps=30, codec='libx264', audio=False)
-        if os.path.exists(logo_path_tmp):
-            os.remove(logo_path_tmp)
-        # SyncShield™ file size guardrail
-        max_size_mb = 10
-        file_size_mb = os.path.getsize(output_path) / (1024 * 1024)
-        if file_size_mb > max_size_mb:
-            raise ValueError(f"SyncShield™: Output file exceeds {max_size_mb}MB (actual: {file_size_mb:.2f}MB)")
-        print(f"✓ Video exported: {output_path} ({file_size_mb:.2f}MB)")
+import os
+import subprocess
+from pathlib import Path
+from PIL import Image, ImageFont
+
+def _drawtext_escape(text):
+    # Escape the characters the drawtext filter treats specially
+    for ch in ('\\', "'", ':', '%'):
+        text = text.replace(ch, '\\' + ch)
+    return text
+
+class SyncCreateVideo:
+    def __init__(self, bg_image_path, product, logo_path=None, font_path=None):
+        self.bg_image_path = Path(bg_image_path)
+        self.product = product
+        self.logo_path = Path(logo_path) if logo_path else Path('assets/logo.png')
+        self.font_path = font_path or 'assets/fonts/Inter-Bold.ttf'
+        self.kiki_green = '#00ff88'
+        self.duration = 5
+        self.fps = 30
+        self.resolution = (1080, 1920)  # 9:16 vertical
+
+    def make_video(self, output_path):
+        width, height = self.resolution
+        frames = self.duration * self.fps
+
+        # High-contrast hook text (center), sized from font metrics —
+        # no ImageMagick render needed just to measure it. The safe-zone
+        # check comes first so an invalid hook fails before any image or
+        # encoder work happens.
+        hook = self.product.get('hook', 'Your Next Best Seller')
+        font = ImageFont.truetype(self.font_path, 110)
+        bbox = font.getbbox(hook)
+        text_w, text_h = bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+        # SyncShield™: Safe zone check for text overlay
+        # TikTok safe zone: avoid bottom 300px and right 200px for overlays
+        # (approximate, can be tuned)
+        text_x, text_y = (width - text_w) // 2, (height - text_h) // 2
+        safe_top = 100
+        safe_bottom = height - 300
+        safe_left = 40
+        safe_right = width - 200
+        if not (safe_left < text_x < safe_right and safe_top < text_y < safe_bottom):
+            raise ValueError("SyncShield™: Text overlay is outside TikTok safe zone.")
+
+        # Logo geometry from the image header only; the actual scaling
+        # happens inside FFmpeg
+        with Image.open(self.logo_path) as logo:
+            logo_w = int(width * 0.18)
+            logo_h = int(logo_w * logo.height / logo.width)
+
+        # One FFmpeg filter graph does the zoom, logo overlay and text
+        # draw in C instead of moviepy's per-frame Python compositing.
+        # The still image supplies a single input frame and zoompan's
+        # d={frames} expands it into the whole clip, so `on` counts
+        # 0..frames-1 and the zoom tops out at 1.03x on the last frame.
+        filter_complex = (
+            f"[0:v]scale={width}:{height},"
+            f"zoompan=z='1+0.03*on/{frames}':d={frames}:s={width}x{height}:fps={self.fps}[bg];"
+            f"[1:v]scale={logo_w}:{logo_h}[logo];"
+            f"[bg][logo]overlay={width - logo_w - 40}:40[v1];"
+            f"[v1]drawtext=fontfile={self.font_path}:text='{_drawtext_escape(hook)}':"
+            f"fontsize=110:fontcolor={self.kiki_green.replace('#', '0x')}:"
+            f"x=(w-text_w)/2:y=(h-text_h)/2"
+        )
+        # SyncShield™ file size guardrail, enforced up front: cap the
+        # encoder bitrate to 95% of the size budget so an over-budget
+        # render cannot happen, instead of encoding the whole video and
+        # discarding it afterwards
+        max_size_mb = 10
+        bitrate_k = int((max_size_mb * 8 * 1024) / self.duration * 0.95)
+        cmd = [
+            'ffmpeg', '-y',
+            '-i', str(self.bg_image_path),
+            '-i', str(self.logo_path),
+            '-filter_complex', filter_complex,
+            '-c:v', 'libx264', '-preset', 'veryfast',
+            '-b:v', f'{bitrate_k}k', '-maxrate', f'{bitrate_k}k',
+            '-bufsize', f'{2 * bitrate_k}k',
+            '-pix_fmt', 'yuv420p',
+            '-r', str(self.fps), '-frames:v', str(frames), '-an',
+            output_path,
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"FFmpeg failed: {result.stderr[-500:]}")
+
+        file_size_mb = os.path.getsize(output_path) / (1024 * 1024)
+        print(f"✓ Video exported: {output_path} ({file_size_mb:.2f}MB)")
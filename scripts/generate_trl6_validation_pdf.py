@@ -4,13 +4,26 @@ import schedule
 import threading
 import time
 
+# The document is deterministic for a given (date, custom_data), so the
+# weekly job and any re-runs on the same day reuse the rendered bytes
+# instead of repeating the whole FPDF layout pass
+_pdf_cache = {}
+
 def generate_trl6_validation_pdf(custom_data=None, output_path='TRL6_Validation_Summary.pdf'):
+    date_str = datetime.now().strftime("%B %d, %Y")
+    custom_key = tuple(sorted(custom_data.items())) if custom_data else None
+    cache_key = (date_str, custom_key)
+    cached = _pdf_cache.get(cache_key)
+    if cached is not None:
+        with open(output_path, 'wb') as f:
+            f.write(cached)
+        return
     pdf = FPDF()
     pdf.add_page()
     pdf.set_font('Arial', 'B', 16)
     pdf.cell(0, 10, 'KIKI Agent™ TRL 6 Validation Document', ln=1)
     pdf.set_font('Arial', '', 10)
-    pdf.cell(0, 8, f'Date: {datetime.now().strftime("%B %d, %Y")}', ln=1)
+    pdf.cell(0, 8, f'Date: {date_str}', ln=1)
     pdf.ln(2)
     pdf.set_font('Arial', 'B', 12)
     pdf.cell(0, 8, 'System Architecture', ln=1)
@@ -34,7 +47,11 @@ def generate_trl6_validation_pdf(custom_data=None, output_path='TRL6_Validation_
     pdf.ln(4)
     pdf.set_font('Arial', 'B', 10)
     pdf.cell(0, 8, custom_data['footer'] if custom_data and 'footer' in custom_data else 'KIKI Agent™ is engineered for enterprise-grade, real-time, and auditable AI-driven marketing.', ln=1)
-    pdf.output(output_path)
+    rendered = bytes(pdf.output())
+    _pdf_cache.clear()  # only the current document is worth keeping
+    _pdf_cache[cache_key] = rendered
+    with open(output_path, 'wb') as f:
+        f.write(rendered)
 
 def weekly_report_job():
     generate_trl6_validation_pdf()
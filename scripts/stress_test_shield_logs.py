@@ -1,23 +1,34 @@
-import time
-import random
-from core.creative_gallery import log_to_shield
-
-def stress_test_shield_logs(n=100, delay=0.05):
-    statuses = ['INFO', 'SHIELD-PASS', 'SHIELD-BLOCK']
-    messages = [
-        'Creative variant passed compliance.',
-        'Blocked: Banned competitor "BrandX" detected.',
-        'AI generated new TikTok ad.',
-        'Blocked: Unsafe language detected.',
-        'INFO: Starting creative generation.',
-        'SHIELD-PASS: All checks passed.',
-        'SHIELD-BLOCK: Copyrighted music detected.'
-    ]
-    for _ in range(n):
-        status = random.choice(statuses)
-        msg = random.choice(messages)
-        log_to_shield(msg, status)
-        time.sleep(delay)
-
-if __name__ == "__main__":
-    stress_test_shield_logs(200, 0.03)
+import time
+import random
+from core.creative_gallery import log_to_shield, log_to_shield_bulk
+
+def stress_test_shield_logs(n=100, delay=0.05, batch_size=0):
+    statuses = ['INFO', 'SHIELD-PASS', 'SHIELD-BLOCK']
+    messages = [
+        'Creative variant passed compliance.',
+        'Blocked: Banned competitor "BrandX" detected.',
+        'AI generated new TikTok ad.',
+        'Blocked: Unsafe language detected.',
+        'INFO: Starting creative generation.',
+        'SHIELD-PASS: All checks passed.',
+        'SHIELD-BLOCK: Copyrighted music detected.'
+    ]
+    if batch_size:
+        # Perf path: no sleeps, one emit per batch instead of per entry
+        batch = []
+        for _ in range(n):
+            batch.append((random.choice(messages), random.choice(statuses)))
+            if len(batch) >= batch_size:
+                log_to_shield_bulk(batch)
+                batch.clear()
+        if batch:
+            log_to_shield_bulk(batch)
+        return
+    for _ in range(n):
+        status = random.choice(statuses)
+        msg = random.choice(messages)
+        log_to_shield(msg, status)
+        time.sleep(delay)
+
+if __name__ == "__main__":
+    stress_test_shield_logs(200, batch_size=100)
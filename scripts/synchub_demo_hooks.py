@@ -1,21 +1,53 @@
 # Live demo hooks for SyncHub integration
 from core.mediator import SyncHub
+import os
 import time
 import threading
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
 hub = SyncHub()
 
 # Live demo: trigger a retraining event from the dashboard
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request
+
+try:
+    from flask_compress import Compress
+except ImportError:  # pragma: no cover - compression is a nice-to-have
+    Compress = None
+
 app = Flask(__name__)
 
+# Demo payloads are JSON with repeating keys, so gzip/brotli pays for
+# itself past a few hundred bytes
+if Compress is not None:
+    app.config['COMPRESS_MIN_SIZE'] = 512
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    Compress(app)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fallback when orjson is unavailable
+    orjson = None
+
+# The bare success body never changes, so serialize it once instead of
+# paying a dict alloc + json.dumps + jsonify Response build per hit
+_OK_BODY = b'{"success": true}'
+
+def _ok_response():
+    return Response(_OK_BODY, mimetype='application/json')
+
+def _json_response(obj):
+    if orjson is None:
+        return jsonify(obj)
+    return Response(orjson.dumps(obj), mimetype='application/json')
+
 @app.route('/demo/trigger_retraining', methods=['POST'])
 def demo_trigger_retraining():
     model = request.json.get('model', 'dRNN')
     reason = request.json.get('reason', 'Manual demo trigger')
     hub.trigger_retraining(model, reason)
-    return jsonify({'success': True, 'model': model, 'reason': reason})
+    return _json_response({'success': True, 'model': model, 'reason': reason})
 
 # Live demo: push a custom event to the audit log
 @app.route('/demo/log_event', methods=['POST'])
@@ -24,48 +56,113 @@ def demo_log_event():
     event_type = request.json.get('event_type', 'DemoEvent')
     payload = request.json.get('payload', '{}')
     hub.log_event(agent, event_type, payload)
-    return jsonify({'success': True})
+    return _ok_response()
 
 # Observability: OpenTelemetry tracing example
 from opentelemetry import trace
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
 
-trace.set_tracer_provider(TracerProvider())
+# Only install the provider once: a re-import (e.g. under the Flask
+# debug reloader) would otherwise spawn a second BatchSpanProcessor
+# export thread doing duplicate work
+if not isinstance(trace.get_tracer_provider(), TracerProvider):
+    trace.set_tracer_provider(TracerProvider())
+    # Tuned for an interactive demo: 1s flush so spans show up promptly,
+    # bigger queue so bursts are not dropped; still async (never Simple)
+    trace.get_tracer_provider().add_span_processor(BatchSpanProcessor(
+        ConsoleSpanExporter(),
+        max_queue_size=4096,
+        schedule_delay_millis=1000,
+        max_export_batch_size=256,
+        export_timeout_millis=10000,
+    ))
 tracer = trace.get_tracer(__name__)
-span_processor = BatchSpanProcessor(ConsoleSpanExporter())
-trace.get_tracer_provider().add_span_processor(span_processor)
+
+def _maybe_preview(span, key, val):
+    # Stringifying payloads onto spans costs more than the span itself,
+    # so the cheap type/length metadata is the default and full
+    # previews are opt-in via environment
+    if os.getenv('KIKI_TRACE_PREVIEW') == '1':
+        span.set_attribute(f'{key}_preview', str(val)[:500])
+        return
+    span.set_attribute(f'{key}_type', type(val).__name__)
+    try:
+        span.set_attribute(f'{key}_len', len(val))
+    except TypeError:
+        pass
 
 @app.route('/demo/observability', methods=['POST'])
 def demo_observability():
-    with tracer.start_as_current_span("demo-span"):
+    with tracer.start_as_current_span("demo-span") as span:
         # Simulate a cross-agent operation
-        hub.log_event('ObservabilityDemo', 'Trace', '{"msg": "Tracing demo event"}')
+        payload = '{"msg": "Tracing demo event"}'
+        _maybe_preview(span, 'payload', payload)
+        hub.log_event('ObservabilityDemo', 'Trace', payload)
         time.sleep(0.1)
-    return jsonify({'success': True})
+    return _ok_response()
 
 # Cloud integration: push all new events to a cloud endpoint
 CLOUD_ENDPOINT = 'https://your-cloud-endpoint/api/events'
+PUSH_BATCH_SIZE = 100
+PUSH_PAGE_SIZE = 500
+
+# Pooled session: one kept-alive TLS connection for every push instead
+# of a fresh handshake per event
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4, pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2)))
+
+def _chunked(rows, size):
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+# Dedicated reader for the pusher: SyncHub keeps the database in WAL
+# mode, so this connection pages through events concurrently with
+# hub.log_event writers without touching hub.lock at all
+import sqlite3
+_reader = sqlite3.connect(hub.db_path, check_same_thread=False)
+# sqlite3.Row materializes rows in C with dict-like access, so building
+# the upload payload is dict(row) instead of per-column index lookups
+_reader.row_factory = sqlite3.Row
+_reader.execute('PRAGMA mmap_size=268435456')
+_reader.execute('PRAGMA cache_size=-32768')  # 32MB page cache kept warm across polls
 
 def push_all_events_to_cloud():
     last_id = 0
+    fail_count = 0
     while True:
-        with hub.lock, sqlite3.connect(hub.db_path) as conn:
-            c = conn.cursor()
-            c.execute('SELECT id, timestamp, agent, event_type, payload FROM events WHERE id > ? ORDER BY id ASC', (last_id,))
-            rows = c.fetchall()
-            for row in rows:
-                event = {'id': row[0], 'timestamp': row[1], 'agent': row[2], 'event_type': row[3], 'payload': row[4]}
-                try:
-                    requests.post(CLOUD_ENDPOINT, json=event, timeout=2)
-                except Exception:
-                    pass
-                last_id = row[0]
-        time.sleep(5)
+        rows = _reader.execute(
+            'SELECT id, timestamp, agent, event_type, payload FROM events WHERE id > ? ORDER BY id ASC LIMIT ?',
+            (last_id, PUSH_PAGE_SIZE)).fetchall()
+        for chunk in _chunked(rows, PUSH_BATCH_SIZE):
+            events = [dict(r) for r in chunk]
+            try:
+                resp = SESSION.post(CLOUD_ENDPOINT + '/batch', json=events, timeout=(2, 5))
+                resp.raise_for_status()
+            except requests.RequestException:
+                # Back off instead of hammering an unreachable endpoint;
+                # last_id stays put, so this chunk is retried after the
+                # sleep rather than dropped
+                fail_count += 1
+                time.sleep(min(60, 2 ** fail_count))
+                break
+            fail_count = 0
+            last_id = chunk[-1]['id']
+        if rows:
+            # More pages may be waiting; drain the backlog before idling
+            continue
+        # Wake as soon as a new event lands; the 5s timeout is only a
+        # polling safety net for writers outside this process
+        with hub.event_cond:
+            hub.event_cond.wait(timeout=5.0)
 
 # To start cloud push in background:
 # t = threading.Thread(target=push_all_events_to_cloud, daemon=True)
 # t.start()
 
 if __name__ == "__main__":
-    app.run(port=5050, debug=True)
+    # No reloader: it re-imports this module and would duplicate the
+    # pusher thread and tracing setup
+    app.run(port=5050, debug=True, use_reloader=False)
@@ -19,9 +19,13 @@ from cmd.creative.synccreate import (
 
 def test_prompt_engineering():
     """Test all 5 variant types with professional prompt engineering."""
-    
-    print("🎨 Professional SD Prompt Engineering Test")
-    print("=" * 100)
+
+    # Buffer the report and emit it in one write at the end: per-line
+    # prints flush to the terminal individually, which dominates the
+    # runtime of this otherwise CPU-light test
+    lines = []
+    lines.append("🎨 Professional SD Prompt Engineering Test")
+    lines.append("=" * 100)
     
     # Setup test data
     product = ProductMetadata(
@@ -67,10 +71,10 @@ def test_prompt_engineering():
     ]
     
     for variant_type, platform, description in variants:
-        print(f"\n{'='*100}")
-        print(f"🎯 {description}")
-        print(f"   Type: {variant_type.value} | Platform: {platform.value}")
-        print(f"{'='*100}")
+        lines.append(f"\n{'='*100}")
+        lines.append(f"🎯 {description}")
+        lines.append(f"   Type: {variant_type.value} | Platform: {platform.value}")
+        lines.append(f"{'='*100}")
         
         # Generate prompts
         positive, negative = PromptEngineer.craft_prompt(
@@ -87,33 +91,35 @@ def test_prompt_engineering():
         # Apply platform optimization
         positive_final = PromptEngineer.optimize_for_platform(positive_enhanced, platform)
         
-        print(f"\n📝 POSITIVE PROMPT ({len(positive_final)} chars):")
-        print(f"   {positive_final[:200]}...")
-        print(f"   ...{positive_final[-100:]}")
-        
-        print(f"\n🚫 NEGATIVE PROMPT ({len(negative)} chars):")
-        print(f"   {negative[:150]}...")
-        
+        lines.append(f"\n📝 POSITIVE PROMPT ({len(positive_final)} chars):")
+        lines.append(f"   {positive_final[:200]}...")
+        lines.append(f"   ...{positive_final[-100:]}")
+
+        lines.append(f"\n🚫 NEGATIVE PROMPT ({len(negative)} chars):")
+        lines.append(f"   {negative[:150]}...")
+
         # Highlight key features
-        print(f"\n✨ KEY FEATURES:")
+        lines.append(f"\n✨ KEY FEATURES:")
         weight_count = positive_final.count(":")
-        print(f"   • Weighted keywords: {weight_count}")
-        print(f"   • Has quality boosters: {'masterpiece' in positive_final}")
-        print(f"   • Has composition rules: {'rule of thirds' in positive_final}")
-        print(f"   • Platform-optimized: {platform.value in positive_final}")
-        print(f"   • Persona-enhanced: {'premium quality' in positive_final or 'attention-grabbing' in positive_final}")
-    
-    print(f"\n{'='*100}")
-    print("✅ Professional prompt engineering test complete!")
-    print("\nKey Capabilities Demonstrated:")
-    print("  • Weight syntax (keyword:1.3) for emphasis")
-    print("  • Quality boosters and technical specifications")
-    print("  • Camera angles and lighting techniques")
-    print("  • Color theory and material specifications")
-    print("  • Platform-specific optimizations")
-    print("  • Persona-driven visual enhancements")
-    print("  • Comprehensive negative prompting")
-    print("=" * 100)
+        lines.append(f"   • Weighted keywords: {weight_count}")
+        lines.append(f"   • Has quality boosters: {'masterpiece' in positive_final}")
+        lines.append(f"   • Has composition rules: {'rule of thirds' in positive_final}")
+        lines.append(f"   • Platform-optimized: {platform.value in positive_final}")
+        lines.append(f"   • Persona-enhanced: {'premium quality' in positive_final or 'attention-grabbing' in positive_final}")
+
+    lines.append(f"\n{'='*100}")
+    lines.append("✅ Professional prompt engineering test complete!")
+    lines.append("\nKey Capabilities Demonstrated:")
+    lines.append("  • Weight syntax (keyword:1.3) for emphasis")
+    lines.append("  • Quality boosters and technical specifications")
+    lines.append("  • Camera angles and lighting techniques")
+    lines.append("  • Color theory and material specifications")
+    lines.append("  • Platform-specific optimizations")
+    lines.append("  • Persona-driven visual enhancements")
+    lines.append("  • Comprehensive negative prompting")
+    lines.append("=" * 100)
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,8 @@
 import datetime
+import functools
 from pathlib import Path
 from typing import List, Dict
+from xml.sax.saxutils import escape
 
 # Static metadata for blog posts. Update this list when adding new posts.
 POSTS: List[Dict[str, str]] = [
@@ -56,26 +58,47 @@ CHANNEL = {
 }
 
 
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+# Memoized: the same dates are parsed for every item render plus the
+# lastBuildDate pass, and they never change between runs
+@functools.lru_cache(maxsize=None)
 def rfc2822(date_str: str) -> str:
-    dt = datetime.datetime.strptime(date_str, "%Y-%m-%d")
+    # Inputs are always YYYY-MM-DD and the output format is fixed, so
+    # slice the fields directly and format against the name tables
+    # instead of going through the generic strptime/strftime machinery
+    y, m, d = int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10])
+    weekday = datetime.date(y, m, d).weekday()
     # Use UTC midnight as publication time
-    return dt.strftime("%a, %d %b %Y 00:00:00 +0000")
+    return f"{_WEEKDAYS[weekday]}, {d:02d} {_MONTHS[m - 1]} {y} 00:00:00 +0000"
 
 
-def render_item(item: Dict[str, str]) -> str:
-    return f"""
+_ITEM_TMPL = """
     <item>
-      <title>{item['title']}</title>
-      <link>{item['link']}</link>
-      <guid isPermaLink=\"true\">{item['link']}</guid>
-      <pubDate>{rfc2822(item['pub_date'])}</pubDate>
-      <description>{item['description']}</description>
+      <title>{title}</title>
+      <link>{link}</link>
+      <guid isPermaLink="true">{link}</guid>
+      <pubDate>{pub_date}</pubDate>
+      <description>{description}</description>
     </item>"""
 
 
-def build_rss(items: List[Dict[str, str]]) -> str:
+def render_item(item: Dict[str, str]) -> str:
+    # escape() keeps &/</> in titles and descriptions from producing an
+    # invalid feed; the shared template is formatted in one pass
+    return _ITEM_TMPL.format_map({
+        "title": escape(item["title"]),
+        "link": escape(item["link"]),
+        "pub_date": rfc2822(item["pub_date"]),
+        "description": escape(item["description"]),
+    })
+
+
+def rss_header(items: List[Dict[str, str]]) -> str:
     last_build = rfc2822(max(p["pub_date"] for p in items))
-    rendered_items = "\n".join(render_item(item) for item in items)
     return f"""<?xml version=\"1.0\" encoding=\"UTF-8\"?>
 <rss version=\"2.0\">
   <channel>
@@ -84,17 +107,28 @@ def build_rss(items: List[Dict[str, str]]) -> str:
     <description>{CHANNEL['description']}</description>
     <language>{CHANNEL['language']}</language>
     <lastBuildDate>{last_build}</lastBuildDate>
-    <ttl>720</ttl>
-{rendered_items}
+    <ttl>720</ttl>"""
+
+
+RSS_FOOTER = """
   </channel>
 </rss>
 """
 
 
+def build_rss(items: List[Dict[str, str]]) -> str:
+    return rss_header(items) + "".join(render_item(item) for item in items) + RSS_FOOTER
+
+
 def main() -> None:
-    rss_content = build_rss(POSTS)
+    # Stream header/items/footer straight to the file: only one item is
+    # ever live in memory instead of the whole concatenated feed
     output_path = Path(__file__).with_name("rss.xml")
-    output_path.write_text(rss_content, encoding="utf-8")
+    with output_path.open("w", encoding="utf-8") as f:
+        f.write(rss_header(POSTS))
+        for item in POSTS:
+            f.write(render_item(item))
+        f.write(RSS_FOOTER)
     print(f"Wrote RSS with {len(POSTS)} items to {output_path}")
 
 